@@ -7,6 +7,8 @@ from salmon.checks.logs import check_log_cambia
 from salmon.checks.mqa import check_mqa
 from salmon.checks.upconverts import test_upconverted
 from salmon.common import commandgroup
+from salmon.common.constants import CHECKED_AUDIO_EXTENSIONS
+from salmon.common.files import file_suffix, walk_files
 from salmon.errors import CRCMismatchError, EditedLogError
 
 
@@ -27,22 +29,21 @@ async def log(path: str) -> None:
     if os.path.isfile(path):
         await _check_log(path)
     elif os.path.isdir(path):
-        for root, _, files in os.walk(path):
-            for f in files:
-                if f.lower().endswith(".log"):
-                    filepath = os.path.join(root, f)
-                    click.secho(f"\nScoring {filepath}...", fg="cyan")
-                    await _check_log(filepath)
+        crc_cache: dict[str, str] = {}
+        for filepath in sorted(entry.path for entry in walk_files(path) if file_suffix(entry.name) == ".log"):
+            click.secho(f"\nScoring {filepath}...", fg="cyan")
+            await _check_log(filepath, crc_cache)
 
 
-async def _check_log(path: str) -> None:
+async def _check_log(path: str, crc_cache: dict[str, str] | None = None) -> None:
     """Score a single log file and display the result.
 
     Args:
         path: Path to the log file to check.
+        crc_cache: Optional CRC32 cache shared between the logs of one run.
     """
     try:
-        await check_log_cambia(path, os.path.dirname(path))
+        await check_log_cambia(path, os.path.dirname(path), crc_cache)
     except EditedLogError:
         click.secho("Error: Edited logs detected!", fg="red", bold=True)
     except CRCMismatchError:
@@ -83,15 +84,13 @@ async def mqa(path):
         else:
             click.secho("Did not find MQA syncword", fg="green")
     elif os.path.isdir(path):
-        for root, _, files in os.walk(path):
-            for f in files:
-                if any(f.lower().endswith(ext) for ext in [".mp3", ".flac"]):
-                    filepath = os.path.join(root, f)
-                    click.secho(f"\nChecking {filepath}...", fg="cyan")
-                    if await check_mqa(filepath):
-                        click.secho("MQA syncword present", fg="red")
-                    else:
-                        click.secho("Did not find MQA syncword", fg="green")
+        for entry in walk_files(path):
+            if file_suffix(entry.name) in CHECKED_AUDIO_EXTENSIONS:
+                click.secho(f"\nChecking {entry.path}...", fg="cyan")
+                if await check_mqa(entry.path):
+                    click.secho("MQA syncword present", fg="red")
+                else:
+                    click.secho("Did not find MQA syncword", fg="green")
 
 
 async def mqa_test(path: str) -> None:
@@ -109,12 +108,7 @@ async def mqa_test(path: str) -> None:
         filepath = path
     elif os.path.isdir(path):
         filepath = next(
-            (
-                os.path.join(root, f)
-                for root, _, files in os.walk(path)
-                for f in files
-                if f.lower().endswith((".mp3", ".flac"))
-            ),
+            (entry.path for entry in walk_files(path) if file_suffix(entry.name) in CHECKED_AUDIO_EXTENSIONS),
             None,
         )
     else:
@@ -5,7 +5,8 @@ import anyio
 import asyncclick as click
 
 from salmon import cfg
-from salmon.common.files import process_files
+from salmon.common.constants import CHECKED_AUDIO_EXTENSIONS
+from salmon.common.files import file_suffix, process_files, walk_files
 
 FLAC_IMPORTANT_REGEXES = [
     re.compile(r"(.+\.flac: testing,.*)\x08ok"),
@@ -47,7 +48,7 @@ async def handle_integrity_check(path: str) -> None:
         click.Abort: If the path is neither a file nor a directory.
     """
     if os.path.isfile(path):
-        if not any(path.lower().endswith(ext) for ext in [".flac", ".mp3"]):
+        if file_suffix(os.path.basename(path)) not in CHECKED_AUDIO_EXTENSIONS:
             click.secho(f"File '{path}' is not a FLAC or MP3 file.", fg="red", bold=True)
             return
 
@@ -98,21 +99,13 @@ async def check_integrity(path: str, _: int | None = None) -> tuple[bool, str]:
     elif path.lower().endswith(".mp3"):
         return await _check_mp3_integrity(path)
     elif os.path.isdir(path):
-        integrities_out: list[str] = []
-        integrities = True
-        audio_files: list[str] = []
-        for root, _dirs, files in os.walk(path):
-            for f in files:
-                if any(f.lower().endswith(ext) for ext in [".mp3", ".flac"]):
-                    audio_files.append(os.path.join(root, f))
+        audio_files = [entry.path for entry in walk_files(path) if file_suffix(entry.name) in CHECKED_AUDIO_EXTENSIONS]
         if not audio_files:
             click.secho("No audio files found in directory", fg="red", bold=True)
             raise click.Abort
         results = await process_files(audio_files, check_integrity, "Checking audio files")
-        for integrity, integrity_out in results:
-            integrities = integrities and integrity
-            integrities_out.append(integrity_out)
-        return integrities, "\n".join(integrities_out)
+        # Only keep the files that reported something; clean files contribute an empty string.
+        return all(integrity for integrity, _ in results), "\n".join(out for _, out in results if out)
     raise click.Abort
 
 
@@ -179,18 +172,11 @@ async def sanitize_integrity(path: str, _: int | None = None) -> bool:
     elif path.lower().endswith(".mp3"):
         return await _sanitize_mp3(path)
     elif os.path.isdir(path):
-        integrities = True
-        audio_files: list[str] = []
-        for root, _dirs, files in os.walk(path):
-            for f in files:
-                if any(f.lower().endswith(ext) for ext in [".mp3", ".flac"]):
-                    audio_files.append(os.path.join(root, f))
+        audio_files = [entry.path for entry in walk_files(path) if file_suffix(entry.name) in CHECKED_AUDIO_EXTENSIONS]
         if not audio_files:
             return True
         results = await process_files(audio_files, sanitize_integrity, "Sanitizing audio files")
-        for integrity in results:
-            integrities = integrities and integrity
-        return integrities
+        return all(results)
     raise click.Abort
 
 
@@ -9,7 +9,8 @@ import asyncclick as click
 import av
 import cambia
 
-from salmon.common.files import process_files
+from salmon.common.constants import AUDIO_EXTENSIONS
+from salmon.common.files import file_suffix, process_files, walk_files
 from salmon.errors import CRCMismatchError, EditedLogError
 
 
@@ -159,12 +160,14 @@ async def _calculate_range_crc_async(track_files: list[str], toc_entries: list[c
     return await anyio.to_thread.run_sync(lambda: _crc32_from_chunks(_iter_range_pcm_chunks(track_files, toc_entries)))
 
 
-async def check_log_cambia(logpath: str, basepath: str) -> None:
+async def check_log_cambia(logpath: str, basepath: str, crc_cache: dict[str, str] | None = None) -> None:
     """Check a log file using Cambia.
 
     Args:
         logpath: Path to the log file to check.
         basepath: Base directory path containing audio files.
+        crc_cache: Optional mapping of audio file path to CRC32, shared between
+            calls so multi-log releases decode each track only once.
 
     Raises:
         ValueError: If log parsing fails, log is edited, or CRC mismatch detected.
@@ -191,11 +194,7 @@ async def check_log_cambia(logpath: str, basepath: str) -> None:
     copy_crc_set = {track.test_and_copy.copy_hash for track in cambia_output.parsed.parsed_logs[0].tracks}
 
     # Get list of files to check
-    files_to_check: list[str] = []
-    for root, _folders, files_ in os.walk(basepath):
-        for f in files_:
-            if os.path.splitext(f.lower())[1] in {".flac", ".mp3", ".m4a"}:
-                files_to_check.append(os.path.join(root, f))
+    files_to_check = [entry.path for entry in walk_files(basepath) if file_suffix(entry.name) in AUDIO_EXTENSIONS]
 
     if not files_to_check:
         raise ValueError("No audio files found!")
@@ -209,8 +208,13 @@ async def check_log_cambia(logpath: str, basepath: str) -> None:
         range_crc = await _calculate_range_crc_async(files_to_check, toc_entries)
         crc_set = {range_crc}
     else:
-        crc_results = await process_files(files_to_check, _calculate_file_crc_async, "Calculating CRC32 hashes")
-        crc_set = set(crc_results)
+        if crc_cache is None:
+            crc_cache = {}
+        missing = [f for f in files_to_check if f not in crc_cache]
+        if missing:
+            crc_results = await process_files(missing, _calculate_file_crc_async, "Calculating CRC32 hashes")
+            crc_cache.update(zip(missing, crc_results, strict=True))
+        crc_set = {crc_cache[f] for f in files_to_check}
 
     if not copy_crc_set.issubset(crc_set):
         raise CRCMismatchError("CRC Mismatch")
@@ -41,6 +41,9 @@ RE_FEAT = re.compile(
 )
 _RE_SPLIT = re.compile("|".join(re.escape(s) for s in SPLIT_CHARS))
 
+AUDIO_EXTENSIONS = frozenset({".flac", ".mp3", ".m4a"})
+# The audio formats the integrity and MQA checks know how to read.
+CHECKED_AUDIO_EXTENSIONS = frozenset({".flac", ".mp3"})
 LOSSY_EXTENSIONS = frozenset({".mp3", ".m4a", ".ogg", ".opus"})
 SCENE_EXTENSIONS = frozenset({".nfo", ".sfv", ".md5"})
 IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".pdf", ".gif"})
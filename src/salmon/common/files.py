@@ -1,12 +1,13 @@
 import os
 import re
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
 from typing import TypeVar, cast
 
 import anyio
 from tqdm import tqdm
 
 from salmon import cfg
+from salmon.common.constants import AUDIO_EXTENSIONS
 
 T = TypeVar("T")
 
@@ -18,16 +19,48 @@ def get_audio_files(path, sort_by_tracknumber=False):
     """
     files = []
     for root, _folders, files_ in os.walk(path):
-        files += [
-            create_relative_path(root, path, f)
-            for f in files_
-            if os.path.splitext(f.lower())[1] in {".flac", ".mp3", ".m4a"}
-        ]
+        files += [create_relative_path(root, path, f) for f in files_ if file_suffix(f) in AUDIO_EXTENSIONS]
     if sort_by_tracknumber:
         return sorted(files, key=_tracknumber_sort_key)
     return sorted(files)
 
 
+def walk_files(path: str) -> Iterator[os.DirEntry[str]]:
+    """Recursively yield the files under a directory as ``os.DirEntry`` objects.
+
+    Unlike ``os.walk`` this reuses the type information ``scandir`` already
+    fetched, so no extra ``stat`` call is made per entry. Symlinked directories
+    are not descended into.
+
+    Args:
+        path: Directory to walk.
+
+    Yields:
+        One DirEntry per regular file (or symlink to a file).
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def file_suffix(name: str) -> str:
+    """Return the lowercased extension of a file name, including the dot.
+
+    A cheaper equivalent of ``os.path.splitext(name)[1].lower()`` for bare names.
+
+    Args:
+        name: File name without any directory component.
+
+    Returns:
+        The extension such as ``".flac"``, or an empty string if there is none.
+    """
+    idx = name.rfind(".")
+    return name[idx:].lower() if idx > 0 else ""
+
+
 def _tracknumber_sort_key(filename):
     """
     Extract a sort key for the filename. Filenames with numbers are sorted
@@ -76,10 +109,15 @@ async def process_files(
     files: list[str],
     process_func: Callable[[str, int], Awaitable[T]],
     desc: str,
+    limit: int | None = None,
 ) -> list[T]:
-    """Process files concurrently using anyio with a capacity limiter."""
+    """Process files concurrently using anyio with a capacity limiter.
+
+    The limiter defaults to ``cfg.upload.simultaneous_threads``; pass ``limit``
+    to override it for workloads with a different natural parallelism.
+    """
     results: list[T | None] = [None] * len(files)
-    limiter = anyio.CapacityLimiter(cfg.upload.simultaneous_threads)
+    limiter = anyio.CapacityLimiter(limit or cfg.upload.simultaneous_threads)
 
     with tqdm(total=len(files), desc=desc, colour="cyan") as pbar:
 
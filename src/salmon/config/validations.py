@@ -211,6 +211,8 @@ class UploadAiReview(BaseStruct):
 
 class Upload(BaseStruct):
     simultaneous_threads: int = 3
+    # Number of tracks to transcode at once; None uses every CPU core
+    transcode_threads: Annotated[int, msgspec.Meta(ge=1)] | None = None
     user_agent: str = "salmon uploading tools"
 
     # Default text editor for click.edit operations
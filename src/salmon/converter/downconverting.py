@@ -9,7 +9,7 @@ import asyncclick as click
 import msgspec
 
 from salmon.common.constants import IMAGE_EXTENSIONS, LOSSY_EXTENSIONS
-from salmon.common.files import process_files
+from salmon.common.files import file_suffix, process_files, walk_files
 from salmon.errors import InvalidSampleRate
 from salmon.release_notification import get_version
 from salmon.tagger.audio_info import gather_audio_info
@@ -129,23 +129,29 @@ def _collect_convert_items(
 # ---------------------------------------------------------------------------
 
 
-def _validate_lossless(path: str) -> None:
-    """Validate that a folder contains no lossy audio files.
+def _scan_source(path: str) -> list[os.DirEntry[str]]:
+    """Walk a source folder once, validating that it contains no lossy audio files.
 
     Args:
         path: Path to the directory to validate.
 
+    Returns:
+        Every file in the folder, for use by _copy_extra_files.
+
     Raises:
         click.Abort: If a lossy file is found.
     """
-    for _root, _, files in os.walk(path):
-        for f in files:
-            if os.path.splitext(f)[1].lower() in LOSSY_EXTENSIONS:
-                click.secho(f"A lossy file was found in the folder ({f}).", fg="red")
-                raise click.Abort
+    entries: list[os.DirEntry[str]] = []
+    for entry in walk_files(path):
+        if file_suffix(entry.name) in LOSSY_EXTENSIONS:
+            click.secho(f"A lossy file was found in the folder ({entry.name}).", fg="red")
+            raise click.Abort
+        entries.append(entry)
+    return entries
 
 
 def _copy_extra_files(
+    entries: list[os.DirEntry[str]],
     path: str,
     new_path: str,
     convert_srcs: frozenset[str],
@@ -155,6 +161,7 @@ def _copy_extra_files(
     """Copy non-conversion files (images, text, 16-bit audio) to the output directory.
 
     Args:
+        entries: Files found by _scan_source.
         path: Source album directory path.
         new_path: Destination album directory path.
         convert_srcs: Set of source paths that will be converted (to exclude).
@@ -163,17 +170,18 @@ def _copy_extra_files(
     src_path = Path(path)
     dst_path = Path(new_path)
 
-    for p in src_path.rglob("*"):
-        if not p.is_file() or str(p) in convert_srcs:
+    for entry in entries:
+        p = Path(entry.path)
+        if str(p) in convert_srcs:
             continue
         rel = p.relative_to(src_path)
-        if essential_only and p.suffix.lower() not in IMAGE_EXTENSIONS:
+        if essential_only and file_suffix(entry.name) not in IMAGE_EXTENSIONS:
             click.secho(f"Skip  {rel}", fg="yellow")
             continue
         out = dst_path / rel
         out.parent.mkdir(parents=True, exist_ok=True)
         click.secho(f"Copy  {rel}", fg="cyan")
-        shutil.copy(p, out)
+        shutil.copyfile(p, out)
 
 
 async def _convert_audio_files(
@@ -239,7 +247,7 @@ async def convert_folder(
     Returns:
         Tuple of (final_sample_rate, new_folder_path).
     """
-    _validate_lossless(path)
+    entries = _scan_source(path)
     new_path = _build_output_path(path, bit_depth, sample_rate)
 
     if os.path.isdir(new_path):
@@ -248,7 +256,7 @@ async def convert_folder(
 
     items = _collect_convert_items(path, new_path, sample_rate)
     convert_srcs = frozenset(item.src for item in items)
-    _copy_extra_files(path, new_path, convert_srcs, essential_only=essential_only)
+    _copy_extra_files(entries, path, new_path, convert_srcs, essential_only=essential_only)
     await _convert_audio_files(items, bit_depth)
 
     final_rate = items[-1].target_rate if items else None
@@ -2,17 +2,20 @@ import asyncio
 import os
 import re
 import shutil
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Literal
+from typing import BinaryIO, Literal
 
+import anyio
+import anyio.to_thread
 import asyncclick as click
 import msgspec
 from mutagen import flac, mp3
-from mutagen.flac import VCFLACDict
-from mutagen.id3 import APIC, TXXX, Frames
+from mutagen.id3 import APIC, TXXX, Frame, Frames
 
+from salmon import cfg
 from salmon.common.constants import IMAGE_EXTENSIONS, LOSSY_EXTENSIONS
-from salmon.common.files import process_files
+from salmon.common.files import file_suffix, process_files, walk_files
 from salmon.release_notification import get_version
 
 Bitrate = Literal["V0", "320"]
@@ -49,6 +52,7 @@ VORBIS_TO_ID3_MAP: dict[str, str] = {
     "label": "TPUB",
     "isrc": "TSRC",
 }
+VORBIS_TO_FRAME_TYPE: dict[str, type[Frame]] = {k: Frames[v] for k, v in VORBIS_TO_ID3_MAP.items()}
 
 
 class TranscodeItem(msgspec.Struct, frozen=True):
@@ -56,10 +60,32 @@ class TranscodeItem(msgspec.Struct, frozen=True):
 
     src: str
     dst: str
-    flac_obj: flac.FLAC
+    bitrate: Bitrate
+    channels: int
+    picture_size: int
     tags: dict[str, list[str]]
 
 
+class FlacMetadata(msgspec.Struct, frozen=True):
+    """The parts of a FLAC file's metadata needed for transcoding."""
+
+    channels: int
+    picture_size: int  # Total size in bytes of all PICTURE blocks, 0 if there are none
+    tags: dict[str, list[str]]
+
+
+# FLAC metadata block types (https://xiph.org/flac/format.html#metadata_block_header)
+_FLAC_STREAMINFO = 0
+_FLAC_VORBIS_COMMENT = 4
+_FLAC_PICTURE = 6
+# Bytes of STREAMINFO up to and including the packed sample rate/channels/bps/total samples field
+_FLAC_STREAMINFO_MIN_SIZE = 18
+
+# Per-frame ID3v2 overhead (header, encoding byte, separators) and safety margin used to
+# size the padding LAME reserves, so that adding our tags later fits without rewriting the MP3
+_ID3_FRAME_OVERHEAD = 16
+_ID3_PADDING_MARGIN = 1024
+
 # Track number / disc number total merging map
 _TOT_MAP: dict[str, frozenset[str]] = {
     "tracknumber": frozenset({"tracktotal", "totaltracks", "total tracks"}),
@@ -84,14 +110,17 @@ def _build_output_path(path: str, bitrate: Bitrate) -> str:
     """
     to_append: list[str] = []
     foldername = os.path.basename(path)
+    # Both patterns match exactly when their keyword appears, so test with plain substring checks
+    foldername_lower = foldername.lower()
+    has_lossless = "lossless" in foldername_lower
 
-    if FLAC_FOLDER_RE.search(foldername):
-        if LOSSLESS_FOLDER_RE.search(foldername):
+    if "flac" in foldername_lower:
+        if has_lossless:
             foldername = FLAC_FOLDER_RE.sub("MP3", foldername)
             foldername = LOSSLESS_FOLDER_RE.sub(bitrate, foldername)
         else:
             foldername = FLAC_FOLDER_RE.sub(f"MP3 {bitrate}", foldername)
-    elif LOSSLESS_FOLDER_RE.search(foldername):
+    elif has_lossless:
         foldername = LOSSLESS_FOLDER_RE.sub(bitrate, foldername)
         to_append.append("MP3")
     else:
@@ -103,24 +132,36 @@ def _build_output_path(path: str, bitrate: Bitrate) -> str:
     return os.path.join(os.path.dirname(path), foldername)
 
 
-def _validate_lossless(path: str) -> None:
-    """Validate that a folder contains only lossless audio files.
+def _scan_source(path: str) -> tuple[list[Path], list[Path]]:
+    """Walk a source folder once, validating it and sorting files by role.
 
     Args:
-        path: Path to the directory to validate.
+        path: Path to the source album directory.
+
+    Returns:
+        Tuple of (sorted FLAC files to transcode, other files that may be copied).
 
     Raises:
         click.Abort: If a lossy file is found in the folder.
     """
-    for _root, _, files in os.walk(path):
-        for f in files:
-            ext = os.path.splitext(f)[1].lower()
-            if ext in LOSSY_EXTENSIONS:
-                click.secho(f"A lossy file was found in the folder ({f}).", fg="red")
-                raise click.Abort
+    flac_files: list[Path] = []
+    extra_files: list[Path] = []
+
+    for entry in walk_files(path):
+        suffix = file_suffix(entry.name)
+        if suffix in LOSSY_EXTENSIONS:
+            click.secho(f"A lossy file was found in the folder ({entry.name}).", fg="red")
+            raise click.Abort
+        if suffix == ".flac":
+            flac_files.append(Path(entry.path))
+        else:
+            extra_files.append(Path(entry.path))
 
+    flac_files.sort()
+    return flac_files, extra_files
 
-def _get_id3_frame(tag_name: str, tag_value: list[str]) -> TXXX:
+
+def _get_id3_frame(tag_name: str, tag_value: list[str]) -> Frame:
     """Convert a Vorbis comment tag to an ID3v2 frame.
 
     Args:
@@ -130,9 +171,8 @@ def _get_id3_frame(tag_name: str, tag_value: list[str]) -> TXXX:
     Returns:
         An ID3v2 frame object.
     """
-    if tag_name in VORBIS_TO_ID3_MAP:
-        frame_name = VORBIS_TO_ID3_MAP[tag_name]
-        frame_type = Frames[frame_name]
+    frame_type = VORBIS_TO_FRAME_TYPE.get(tag_name)
+    if frame_type is not None:
         return frame_type(encoding=3, text=tag_value)
     return TXXX(encoding=3, desc=tag_name, text=tag_value)
 
@@ -151,7 +191,7 @@ def _prepare_tags(tags: dict[str, list[str]]) -> dict[str, list[str]]:
     Raises:
         ValueError: If conflicting total values are found.
     """
-    # Filter out unwanted tags
+    # Filter out unwanted tags; this is the only copy, everything below edits it in place
     result = {k: v for k, v in tags.items() if not k.startswith("replaygain") and k != "encoder"}
 
     # Merge track/disc totals into number tags
@@ -173,62 +213,229 @@ def _prepare_tags(tags: dict[str, list[str]]) -> dict[str, list[str]]:
             details = ", ".join(f"{name}={value!r}" for name, value in invalid_entries)
             raise ValueError(f"Non-integer total values for {tag}: {details}")
 
-        # Remove total keys
-        result = {k: v for k, v in result.items() if k not in used}
-
-        if len(tot_vals) == 1:
-            total = str(tot_vals.pop())
-            nr = result[tag][0]
-            result = {**result, tag: [f"{nr}/{total}"]}
-        else:
+        if len(tot_vals) != 1:
             raise ValueError(f"conflicting values of {' and '.join(used)}")
 
+        # Remove total keys
+        for t in used:
+            del result[t]
+        result[tag] = [f"{result[tag][0]}/{tot_vals.pop()}"]
+
     return result
 
 
-def _parse_flac_tags(flac_path: Path) -> tuple[flac.FLAC, dict[str, list[str]]]:
-    """Read a FLAC file and extract its cleaned tags.
+def _estimate_id3_size(tags: dict[str, list[str]], picture_size: int) -> int:
+    """Estimate how many bytes the ID3v2 frames written by _copy_tags will take.
+
+    LAME reserves this much padding in the tag it writes, so mutagen can later
+    update the tag in place instead of rewriting the whole MP3 to grow it. The
+    estimate errs slightly high; mutagen keeps up to 10 KiB of spare padding.
+
+    Args:
+        tags: Cleaned tag dictionary.
+        picture_size: Total size of the FLAC PICTURE blocks.
+
+    Returns:
+        Estimated tag size in bytes.
+    """
+    size = picture_size + _ID3_PADDING_MARGIN
+    for key, values in tags.items():
+        size += _ID3_FRAME_OVERHEAD + len(key) + sum(len(v.encode()) + 1 for v in values)
+    return size
+
+
+def _parse_vorbis_comment(data: bytes, flac_path: Path) -> dict[str, list[str]]:
+    """Decode the body of a VORBIS_COMMENT block.
+
+    Keys are lowercased and repeated keys are merged, matching mutagen's
+    ``VCommentDict.as_dict()``.
+
+    Args:
+        data: Raw block body.
+        flac_path: Path of the file, used in error messages.
+
+    Returns:
+        Mapping of lowercase tag name to its values.
+
+    Raises:
+        ValueError: If a length or the comment count runs past the end of the block.
+    """
+
+    def read_length(pos: int) -> int:
+        if pos + 4 > len(data):
+            raise ValueError(f"Malformed VORBIS_COMMENT block: {flac_path}")
+        return int.from_bytes(data[pos : pos + 4], "little")
+
+    tags: dict[str, list[str]] = {}
+    pos = 4 + read_length(0)
+    count = read_length(pos)
+    pos += 4
+    # Every comment needs at least its 4-byte length, so a corrupt count fails here instead of looping
+    if count * 4 > len(data) - pos:
+        raise ValueError(f"Malformed VORBIS_COMMENT block: {flac_path}")
+    for _ in range(count):
+        length = read_length(pos)
+        pos += 4
+        if pos + length > len(data):
+            raise ValueError(f"Malformed VORBIS_COMMENT block: {flac_path}")
+        comment = data[pos : pos + length].decode("utf-8", "replace")
+        pos += length
+        key, sep, value = comment.partition("=")
+        if sep:
+            tags.setdefault(key.lower(), []).append(value)
+    return tags
+
+
+def _iter_flac_blocks(f: BinaryIO, flac_path: Path) -> Iterator[tuple[int, int]]:
+    """Walk the metadata block headers of an open FLAC file.
+
+    After each yield the file is positioned at the start of the block body; the
+    caller may read it or not, the next iteration seeks past it either way.
+
+    Args:
+        f: FLAC file opened in binary mode at offset 0.
+        flac_path: Path of the file, used in error messages.
+
+    Yields:
+        Tuple of (block type, block body length).
+
+    Raises:
+        ValueError: If the file is not a FLAC file.
+    """
+    magic = f.read(4)
+    if magic[:3] == b"ID3":
+        # Skip a (non-standard) leading ID3v2 tag; its size is a 28-bit syncsafe integer.
+        id3_header = f.read(6)
+        size = 0
+        for byte in id3_header[2:6]:
+            size = size << 7 | byte & 0x7F
+        f.seek(size, os.SEEK_CUR)
+        magic = f.read(4)
+    if magic != b"fLaC":
+        raise ValueError(f"Not a valid FLAC file: {flac_path}")
+
+    is_last = False
+    while not is_last:
+        block_header = f.read(4)
+        if len(block_header) < 4:
+            return
+        is_last = bool(block_header[0] & 0x80)
+        length = int.from_bytes(block_header[1:4], "big")
+        body_start = f.tell()
+        yield block_header[0] & 0x7F, length
+        f.seek(body_start + length)
+
+
+def _read_flac_metadata(flac_path: Path) -> FlacMetadata:
+    """Read the channel count and Vorbis comments of a FLAC file.
+
+    Only the STREAMINFO and VORBIS_COMMENT blocks are decoded; every other block
+    (pictures, padding, seektable...) is skipped with a seek, which is much
+    cheaper than building a full mutagen FLAC object.
 
     Args:
         flac_path: Path to the FLAC file.
 
     Returns:
-        Tuple of (FLAC object, cleaned tag dictionary).
+        FlacMetadata for the file.
 
     Raises:
-        ValueError: If FLAC file has no tags or unexpected tag type.
+        ValueError: If the file is not a FLAC file, lacks the needed blocks or
+            they are malformed.
     """
-    fl = flac.FLAC(flac_path)
-    tags = fl.tags
+    channels: int | None = None
+    picture_size = 0
+    tags: dict[str, list[str]] | None = None
+
+    with open(flac_path, "rb") as f:
+        for block_type, length in _iter_flac_blocks(f, flac_path):
+            if block_type == _FLAC_STREAMINFO:
+                streaminfo = f.read(length)
+                if len(streaminfo) < _FLAC_STREAMINFO_MIN_SIZE:
+                    raise ValueError(f"Truncated STREAMINFO block: {flac_path}")
+                channels = ((streaminfo[12] >> 1) & 0x07) + 1
+            elif block_type == _FLAC_VORBIS_COMMENT and tags is None:
+                tags = _parse_vorbis_comment(f.read(length), flac_path)
+            elif block_type == _FLAC_PICTURE:
+                picture_size += length
+
+    if channels is None:
+        raise ValueError(f"FLAC file has no STREAMINFO block: {flac_path}")
     if tags is None:
         raise ValueError(f"FLAC file has no tags: {flac_path}")
-    if not isinstance(tags, VCFLACDict):
-        raise ValueError(f"FLAC tags are not VCommentDict: {flac_path}")
-    return fl, _prepare_tags(tags.as_dict())
+    return FlacMetadata(channels=channels, picture_size=picture_size, tags=tags)
+
+
+def _read_flac_pictures(flac_path: Path) -> list[flac.Picture]:
+    """Read only the embedded PICTURE blocks of a FLAC file.
+
+    Args:
+        flac_path: Path to the FLAC file.
+
+    Returns:
+        The embedded pictures, in file order.
+
+    Raises:
+        ValueError: If the file is not a FLAC file.
+    """
+    with open(flac_path, "rb") as f:
+        return [
+            flac.Picture(f.read(length))
+            for block_type, length in _iter_flac_blocks(f, flac_path)
+            if block_type == _FLAC_PICTURE
+        ]
+
+
+def _parse_flac_tags(flac_path: Path) -> tuple[FlacMetadata, dict[str, list[str]]]:
+    """Read a FLAC file and extract its cleaned tags.
+
+    Args:
+        flac_path: Path to the FLAC file.
+
+    Returns:
+        Tuple of (FLAC metadata, cleaned tag dictionary).
+
+    Raises:
+        ValueError: If the file is not a valid FLAC file or has no tags.
+    """
+    meta = _read_flac_metadata(flac_path)
+    return meta, _prepare_tags(meta.tags)
 
 
 def _collect_transcode_items(
+    flac_files: list[Path],
     path: str,
-    new_path: str,
+    new_paths: dict[Bitrate, str],
 ) -> list[TranscodeItem]:
-    """Collect all FLAC files and compute their output paths and tags.
+    """Read the tags of each FLAC file and compute its output path for every bitrate.
+
+    Each FLAC file is parsed once no matter how many bitrates it is transcoded to.
 
     Args:
+        flac_files: FLAC files found by _scan_source.
         path: Source album directory path.
-        new_path: Destination album directory path.
+        new_paths: Destination album directory path per bitrate.
 
     Returns:
         List of TranscodeItem structs.
     """
     src_path = Path(path)
-    dst_path = Path(new_path)
     items: list[TranscodeItem] = []
 
-    for flac_file in sorted(src_path.rglob("*.flac")):
-        fl, tag_dict = _parse_flac_tags(flac_file)
+    for flac_file in flac_files:
+        meta, tag_dict = _parse_flac_tags(flac_file)
         rel = flac_file.relative_to(src_path).with_suffix(".mp3")
-        mp3_path = dst_path / rel
-        items.append(TranscodeItem(src=str(flac_file), dst=str(mp3_path), flac_obj=fl, tags=tag_dict))
+        for bitrate, new_path in new_paths.items():
+            items.append(
+                TranscodeItem(
+                    src=str(flac_file),
+                    dst=str(Path(new_path) / rel),
+                    bitrate=bitrate,
+                    channels=meta.channels,
+                    picture_size=meta.picture_size,
+                    tags=tag_dict,
+                )
+            )
 
     return items
 
@@ -238,17 +445,18 @@ def _collect_transcode_items(
 # ---------------------------------------------------------------------------
 
 
-def _copy_tags(tag_dict: dict[str, list[str]], flac_obj: flac.FLAC, mp3_path: Path) -> None:
-    """Copy tags and embedded pictures from a FLAC object to an MP3 file.
+def _copy_tags(item: TranscodeItem) -> None:
+    """Copy tags and embedded pictures from a FLAC file to its MP3 transcode.
+
+    Pictures are only loaded here, and only if the FLAC file has any.
 
     Args:
-        tag_dict: Cleaned tag dictionary.
-        flac_obj: Source FLAC file object.
-        mp3_path: Path to the destination MP3 file.
+        item: The transcoded item; its MP3 file must already exist.
 
     Raises:
         ValueError: If MP3 tags cannot be created.
     """
+    mp3_path = Path(item.dst)
     mp3_thing = mp3.MP3(mp3_path)
 
     if not mp3_thing.tags:
@@ -256,22 +464,30 @@ def _copy_tags(tag_dict: dict[str, list[str]], flac_obj: flac.FLAC, mp3_path: Pa
     if mp3_thing.tags is None:
         raise ValueError(f"Failed to create tags for MP3 file: {mp3_path}")
 
-    for k, v in tag_dict.items():
+    for k, v in item.tags.items():
         mp3_thing.tags.add(_get_id3_frame(k, v))
 
-    for pic in flac_obj.pictures:
-        mp3_thing.tags.add(APIC(encoding=3, mime=pic.mime, type=pic.type, desc=pic.desc, data=pic.data))
+    if item.picture_size:
+        for pic in _read_flac_pictures(Path(item.src)):
+            mp3_thing.tags.add(APIC(encoding=3, mime=pic.mime, type=pic.type, desc=pic.desc, data=pic.data))
 
     mp3_thing.save(v1=0, v2_version=4)
 
 
-def _copy_extra_files(path: str, new_path: str, *, essential_only: bool = False) -> None:
+def _copy_extra_files(
+    extra_files: list[Path],
+    path: str,
+    new_path: str,
+    *,
+    essential_only: bool = False,
+) -> None:
     """Copy non-audio files to the output directory.
 
     By default all non-FLAC files are copied except those in SKIP_EXTENSIONS.
     When essential_only is True, only image files (matching IMAGE_EXTENSIONS) are kept.
 
     Args:
+        extra_files: Non-FLAC files found by _scan_source.
         path: Source album directory path.
         new_path: Destination album directory path.
         essential_only: If True, only copy image files; skip everything else.
@@ -279,9 +495,7 @@ def _copy_extra_files(path: str, new_path: str, *, essential_only: bool = False)
     src_path = Path(path)
     dst_path = Path(new_path)
 
-    for p in src_path.rglob("*"):
-        if not p.is_file() or p.suffix.lower() == ".flac":
-            continue
+    for p in extra_files:
         rel = p.relative_to(src_path)
         if p.suffix.lower() in SKIP_EXTENSIONS:
             click.secho(f"Skip  {rel}", fg="yellow")
@@ -292,32 +506,30 @@ def _copy_extra_files(path: str, new_path: str, *, essential_only: bool = False)
         click.secho(f"Copy  {rel}", fg="cyan")
         out = dst_path / rel
         out.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(p, out)
+        shutil.copyfile(p, out)
 
 
-async def _flac_to_mp3(lame_qual: Bitrate, flac_path: str, mp3_path: str) -> None:
+async def _flac_to_mp3(lame_qual: Bitrate, flac_path: str, mp3_path: str, id3_padding: int = 0) -> None:
     """Decode a FLAC file and pipe directly to LAME for MP3 encoding.
 
-    Uses asyncio subprocesses to connect flac stdout to lame stdin,
-    avoiding temporary files.
+    Uses asyncio subprocesses to connect flac stdout to lame stdin through an
+    anonymous pipe, so decoded audio never touches the disk.
 
     Args:
         lame_qual: LAME quality setting key (e.g. "V0", "320").
         flac_path: Path to the source FLAC file.
-        mp3_path: Destination path for the MP3 file.
+        mp3_path: Destination path for the MP3 file; its directory must exist.
+        id3_padding: Bytes of padding LAME should reserve in its ID3v2 tag.
 
     Raises:
         RuntimeError: If FLAC decoding or LAME encoding fails.
     """
-    Path(mp3_path).parent.mkdir(parents=True, exist_ok=True)
-
     read_fd, write_fd = os.pipe()
     try:
         flac_proc = await asyncio.create_subprocess_exec(
             "flac",
             "-Vdsc",
-            "-o",
-            "-",
+            "--",
             flac_path,
             stdout=write_fd,
             stderr=asyncio.subprocess.PIPE,
@@ -331,6 +543,8 @@ async def _flac_to_mp3(lame_qual: Bitrate, flac_path: str, mp3_path: str) -> Non
                 *LAME_COMMAND_MAP[lame_qual],
                 "--quiet",
                 "--add-id3v2",
+                "--pad-id3v2-size",
+                str(id3_padding),
                 "--ignore-tag-errors",
                 "-",
                 mp3_path,
@@ -349,8 +563,12 @@ async def _flac_to_mp3(lame_qual: Bitrate, flac_path: str, mp3_path: str) -> Non
         if read_fd >= 0:
             os.close(read_fd)
 
-    _, flac_err = await flac_proc.communicate()
-    _, lame_err = await lame_proc.communicate()
+    # Drain both stderr pipes together so neither process can stall on a full buffer.
+    (_, flac_err), (_, lame_err) = await asyncio.gather(flac_proc.communicate(), lame_proc.communicate())
+
+    # A LAME failure makes flac die on a broken pipe, so report LAME first to surface the root cause.
+    if lame_proc.returncode:
+        raise RuntimeError(lame_err.decode() or "LAME encoding failed")
 
     if flac_proc.returncode:
         err = flac_err.decode()
@@ -358,32 +576,35 @@ async def _flac_to_mp3(lame_qual: Bitrate, flac_path: str, mp3_path: str) -> Non
             click.secho(err, fg="yellow")
         raise RuntimeError(f"FLAC decoding failed with code {flac_proc.returncode}")
 
-    if lame_proc.returncode:
-        raise RuntimeError(lame_err.decode() or "LAME encoding failed")
-
 
-async def _transcode_audio_files(
-    items: list[TranscodeItem],
-    bitrate: Bitrate,
-) -> None:
+async def _transcode_audio_files(items: list[TranscodeItem]) -> None:
     """Transcode FLAC files to MP3 concurrently.
 
+    LAME is single-threaded, so one track is encoded per CPU core unless
+    ``cfg.upload.transcode_threads`` says otherwise. Items for different
+    bitrates share the same pool, so no core idles while one bitrate finishes.
+
     Args:
         items: List of TranscodeItem structs.
-        bitrate: LAME quality setting key (e.g. "V0", "320").
     """
     if not items:
         return
 
     async def _transcode_one(file: str, idx: int) -> None:
         item = items[idx]
-        if item.flac_obj.info.channels > 2:
-            raise ValueError(f"{item.src} has {item.flac_obj.info.channels} channels. Cannot convert to MP3.")
-        await _flac_to_mp3(bitrate, item.src, item.dst)
-        _copy_tags(item.tags, item.flac_obj, Path(item.dst))
+        if item.channels > 2:
+            raise ValueError(f"{item.src} has {item.channels} channels. Cannot convert to MP3.")
+        await _flac_to_mp3(item.bitrate, item.src, item.dst, _estimate_id3_size(item.tags, item.picture_size))
+        # Tag writing is blocking file I/O; keep it off the event loop so other encodes keep flowing.
+        await anyio.to_thread.run_sync(_copy_tags, item)
+
+    # Create each output directory once up front rather than once per track.
+    for out_dir in {Path(item.dst).parent for item in items}:
+        out_dir.mkdir(parents=True, exist_ok=True)
 
     file_paths = [item.src for item in items]
-    await process_files(file_paths, _transcode_one, "Transcoding")
+    limit = cfg.upload.transcode_threads or os.cpu_count()
+    await process_files(file_paths, _transcode_one, "Transcoding", limit=limit)
 
 
 # ---------------------------------------------------------------------------
@@ -403,26 +624,50 @@ async def transcode_folder(path: str, bitrate: Bitrate, essential_only: bool = F
     Returns:
         Path to the newly created transcoded directory.
     """
-    _validate_lossless(path)
-    new_path = _build_output_path(path, bitrate)
-
-    if os.path.isdir(new_path):
-        expected_mp3s = {Path(item.dst).name for item in _collect_transcode_items(path, new_path)}
-        existing_files = {f for f in os.listdir(new_path) if f.lower().endswith(".mp3")}
-        if expected_mp3s and expected_mp3s <= existing_files:
-            click.secho(f"{new_path} already exists.", fg="yellow")
-            return new_path
-        click.secho(
-            f"{new_path} exists but appears incomplete, re-transcoding...",
-            fg="yellow",
-        )
-        shutil.rmtree(new_path)
+    new_paths = await transcode_folders(path, [bitrate], essential_only=essential_only)
+    return new_paths[bitrate]
+
+
+async def transcode_folders(path: str, bitrates: Iterable[Bitrate], essential_only: bool = False) -> dict[Bitrate, str]:
+    """Transcode a lossless folder to MP3 at several bitrates in one pass.
+
+    The source folder is scanned and each FLAC file's metadata is read once,
+    then the encodes for all bitrates run through a single worker pool.
+
+    Args:
+        path: Path to the directory containing lossless audio files.
+        bitrates: Target MP3 bitrates (e.g. "V0", "320").
+        essential_only: If True, only image files are copied; all other extra
+            files (scans, cues, logs, etc.) are skipped.
+
+    Returns:
+        Mapping of bitrate to the path of its transcoded directory.
+    """
+    flac_files, extra_files = _scan_source(path)
+    new_paths = {bitrate: _build_output_path(path, bitrate) for bitrate in bitrates}
+    pending: dict[Bitrate, str] = {}
+
+    for bitrate, new_path in new_paths.items():
+        if os.path.isdir(new_path):
+            expected_mp3s = {f.with_suffix(".mp3").name for f in flac_files}
+            existing_files = {f for f in os.listdir(new_path) if f.lower().endswith(".mp3")}
+            if expected_mp3s and expected_mp3s <= existing_files:
+                click.secho(f"{new_path} already exists.", fg="yellow")
+                continue
+            click.secho(
+                f"{new_path} exists but appears incomplete, re-transcoding...",
+                fg="yellow",
+            )
+            shutil.rmtree(new_path)
+        pending[bitrate] = new_path
 
-    items = _collect_transcode_items(path, new_path)
-    _copy_extra_files(path, new_path, essential_only=essential_only)
-    await _transcode_audio_files(items, bitrate)
+    if pending:
+        items = _collect_transcode_items(flac_files, path, pending)
+        for new_path in pending.values():
+            _copy_extra_files(extra_files, path, new_path, essential_only=essential_only)
+        await _transcode_audio_files(items)
 
-    return new_path
+    return new_paths
 
 
 def generate_transcode_description(url: str, bitrate: Bitrate) -> str:
@@ -1,3 +1,4 @@
+import asyncio
 import re
 from typing import Any
 
@@ -61,8 +62,11 @@ class TidalBase(BaseScraper):
         cc = rls_id[0] if isinstance(rls_id, tuple) else cfg.metadata.tidal.regions[0].upper()
         try:
             params["countrycode"] = cc
-            data = await self.get_json(f"/albums/{album_id}", params=params)
-            tracklist = await self.get_json(f"/albums/{album_id}/tracks", params=params)
+            # The two endpoints are independent, so fetch them concurrently to save a round trip.
+            data, tracklist = await asyncio.gather(
+                self.get_json(f"/albums/{album_id}", params=params),
+                self.get_json(f"/albums/{album_id}/tracks", params=params),
+            )
             data["tracklist"] = tracklist["items"]
             data["_country_code"] = cc
             return data
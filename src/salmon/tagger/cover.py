@@ -136,6 +136,9 @@ def get_8kib_padding(info: PaddingInfo):
 
 
 def compress_pictures(path):
+    # Looked up once; a cover extracted from the first oversized file is reused for the rest.
+    cover_file = get_cover_from_path(path)
+    cover_picture: Picture | None = None  # Built (and resized) once, then embedded in every file that needs it
     for filename in get_audio_files(path):
         if not filename.lower().endswith(".flac"):
             continue
@@ -153,8 +156,6 @@ def compress_pictures(path):
             fg="cyan",
         )
 
-        cover_file = get_cover_from_path(path)
-
         if padding_size + cover_sizes > humanfriendly.parse_size("1MiB"):
             click.secho(
                 f"Total size ({humanfriendly.format_size(padding_size + cover_sizes, binary=True)}) exceeds 1MiB!",
@@ -185,32 +186,34 @@ def compress_pictures(path):
                 click.secho("No cover file found!", fg="red")
                 continue
 
-            with open(cover_file, "rb") as c:
-                data = c.read()
-
-            max_embedded_image_size = humanfriendly.parse_size("1MiB") - humanfriendly.parse_size("8KiB")
-
-            picture = Picture()
-
-            if len(data) < max_embedded_image_size:
-                click.secho(
-                    f"Cover size ({humanfriendly.format_size(len(data), binary=True)}) within limit",
-                    fg="bright_green",
-                )
-                picture.mime = Image.open(cover_file).get_format_mimetype()
-            else:
-                click.secho(
-                    f"Resizing oversized cover ({humanfriendly.format_size(len(data), binary=True)})...",
-                    fg="yellow",
-                )
-                image = Image.open(cover_file)
-                image.thumbnail((1000, 1000))
-                data = compress_to_target_size(image, max_embedded_image_size)
-                picture.mime = "image/jpeg"
-
-            picture.data = data
-            picture.type = PictureType.COVER_FRONT
-            audio.add_picture(picture)
+            if cover_picture is None:
+                with open(cover_file, "rb") as c:
+                    data = c.read()
+
+                max_embedded_image_size = humanfriendly.parse_size("1MiB") - humanfriendly.parse_size("8KiB")
+
+                cover_picture = Picture()
+
+                if len(data) < max_embedded_image_size:
+                    click.secho(
+                        f"Cover size ({humanfriendly.format_size(len(data), binary=True)}) within limit",
+                        fg="bright_green",
+                    )
+                    cover_picture.mime = Image.open(cover_file).get_format_mimetype()
+                else:
+                    click.secho(
+                        f"Resizing oversized cover ({humanfriendly.format_size(len(data), binary=True)})...",
+                        fg="yellow",
+                    )
+                    image = Image.open(cover_file)
+                    image.thumbnail((1000, 1000))
+                    data = compress_to_target_size(image, max_embedded_image_size)
+                    cover_picture.mime = "image/jpeg"
+
+                cover_picture.data = data
+                cover_picture.type = PictureType.COVER_FRONT
+
+            audio.add_picture(cover_picture)
             audio.save(padding=get_8kib_padding)
             click.secho(f"Saved {filename} with optimized cover", fg="bright_green")
         else:
@@ -1,6 +1,5 @@
 import os
 import shutil
-from pathlib import Path
 
 import asyncclick as click
 
@@ -31,8 +30,10 @@ async def check_folder_structure(path: str, scene: bool, *, essential_only: bool
         click.secho("\nChecking folder structure...", fg="cyan", bold=True)
         try:
             await _check_illegal_folders(path)
-            _check_path_lengths(path, scene)
-            _check_zero_len_folder(path)
+            # One walk serves both name checks; truncation never produces an empty name.
+            tree = list(os.walk(path))
+            _check_path_lengths(tree, scene)
+            _check_zero_len_folder(tree)
             await _check_extensions(path, scene, essential_only=essential_only)
             return
         except NoncompliantFolderStructure:
@@ -88,7 +89,7 @@ async def _check_illegal_folders(path: str) -> None:
                         break
 
 
-def _check_path_lengths(path: str, scene: bool) -> None:
+def _check_path_lengths(tree: list[tuple[str, list[str], list[str]]], scene: bool) -> None:
     """Verify that all file and folder paths are no longer than 180 characters.
 
     Paths are measured relative to the configured download directory. Files with
@@ -96,7 +97,7 @@ def _check_path_lengths(path: str, scene: bool) -> None:
     exceeding 250 characters cannot be safely truncated and raise immediately.
 
     Args:
-        path: Absolute path to the release folder being checked.
+        tree: ``os.walk`` output for the release folder being checked.
         scene: Whether the release is a scene release. Scene releases are never
             auto-truncated; any offending path raises instead.
 
@@ -106,7 +107,7 @@ def _check_path_lengths(path: str, scene: bool) -> None:
     """
     offending_files, really_offending_files = [], []
     root_len = len(cfg.directory.download_directory) + 1
-    for root, _, files in os.walk(path):
+    for root, _, files in tree:
         if len(os.path.abspath(root)) - root_len > 180:
             click.secho("A subfolder has a path length >180 characters.", fg="red")
             raise NoncompliantFolderStructure
@@ -147,21 +148,20 @@ def _check_path_lengths(path: str, scene: bool) -> None:
         click.echo(f" >> {newpath}")
 
 
-def _check_zero_len_folder(path: str) -> None:
+def _check_zero_len_folder(tree: list[tuple[str, list[str], list[str]]]) -> None:
     """Verify that no zero-length (empty-name) folder segments exist in any path.
 
-    Uses ``pathlib`` to iterate through every entry under *path* and checks
-    whether any directory or file has an empty (or whitespace-only) name,
-    which would indicate a malformed folder structure.
+    Checks every directory and file name in *tree* for an empty (or
+    whitespace-only) name, which would indicate a malformed folder structure.
 
     Args:
-        path: Absolute path to the release folder being checked.
+        tree: ``os.walk`` output for the release folder being checked.
 
     Raises:
         NoncompliantFolderStructure: If a zero-length folder segment is found.
     """
-    for item in Path(path).rglob("*"):
-        if not item.name.strip():
+    for _root, dirs, files in tree:
+        if any(not name.strip() for name in (*dirs, *files)):
             click.secho("A zero length folder exists in this directory.", fg="red")
             raise NoncompliantFolderStructure
     click.secho("No zero length folders were found.", fg="green")
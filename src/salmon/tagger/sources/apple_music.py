@@ -1,15 +1,19 @@
 import re
-from collections import defaultdict
 
 from salmon.common import RE_FEAT, parse_copyright
 from salmon.errors import ScrapeError
 from salmon.sources import AppleMusicBase
 from salmon.tagger.sources.base import MetadataMixin
 
-ALIAS_GENRE = {
-    "Hip-Hop/Rap": {"Hip Hop", "Rap"},
-    "R&B/Soul": {"Rhythm & Blues", "Soul"},
-    "Music": {},  # Aliasing Music to an empty set because we don't want a genre 'music'
+# Pre-compiled regular expressions for release type inference
+RE_EP = re.compile(r"\bE\.?P\.?\b", re.IGNORECASE)
+RE_SINGLE = re.compile(r"Single$", re.IGNORECASE)
+RE_GUEST_SEPARATOR = re.compile(r" (?:&|and|feat\.|ft\.|featuring) |, ")
+
+ALIAS_GENRE: dict[str, frozenset[str]] = {
+    "Hip-Hop/Rap": frozenset({"Hip Hop", "Rap"}),
+    "R&B/Soul": frozenset({"Rhythm & Blues", "Soul"}),
+    "Music": frozenset(),  # Aliasing Music to an empty set because we don't want a genre 'music'
 }
 
 
@@ -60,11 +64,13 @@ class Scraper(AppleMusicBase, MetadataMixin):
         """Parse release year from amp-api album releaseDate."""
         try:
             release_date = soup["album"].get("releaseDate", "")
-            if release_date:
-                year_match = re.search(r"(\d{4})", release_date)
-                if year_match:
-                    return int(year_match.group(1))
-            raise ScrapeError("No valid release date found in Apple Music API response")
+            if not release_date:
+                raise ScrapeError("No valid release date found in Apple Music API response")
+            # amp-api dates are ISO-8601, so the year is always the first four characters
+            year = release_date[:4]
+            if not year.isdigit() or release_date[4:5] not in ("", "-", "T"):
+                raise ScrapeError(f"Unexpected release date format in Apple Music API response: {release_date}")
+            return int(year)
         except (TypeError, ValueError) as e:
             raise ScrapeError("Could not parse release year from Apple Music API") from e
 
@@ -79,9 +85,9 @@ class Scraper(AppleMusicBase, MetadataMixin):
             name = attrs.get("name", "").strip()
             track_count = attrs.get("trackCount", 0) or 0
 
-            if re.search(r"\bE\.?P\.?\b", name, re.IGNORECASE):
+            if RE_EP.search(name):
                 return "EP"
-            if re.search(r"-? *Single$", name, re.IGNORECASE):
+            if RE_SINGLE.search(name):
                 return "Single"
 
             if attrs.get("isSingle"):
@@ -141,7 +147,9 @@ class Scraper(AppleMusicBase, MetadataMixin):
         ``attributes`` dict containing name, artistName, trackNumber,
         discNumber, isrc, etc.
         """
-        tracks: dict[str, dict] = defaultdict(dict)
+        tracks: dict[str, dict] = {}
+        # Album tracks usually share one main artist, so reuse its credit tuple
+        main_credits: dict[str, tuple[str, str]] = {}
 
         try:
             track_list = soup.get("tracks", [])
@@ -166,7 +174,10 @@ class Scraper(AppleMusicBase, MetadataMixin):
                 artists: list[tuple[str, str]] = []
                 artist_name = attrs.get("artistName", "")
                 if artist_name:
-                    artists.append((artist_name, "main"))
+                    credit = main_credits.get(artist_name)
+                    if credit is None:
+                        credit = main_credits[artist_name] = (artist_name, "main")
+                    artists.append(credit)
 
                 # Extract featured artists embedded in track title
                 feat_match = RE_FEAT.search(raw_title)
@@ -175,7 +186,11 @@ class Scraper(AppleMusicBase, MetadataMixin):
                         if (guest, "guest") not in artists:
                             artists.append((guest, "guest"))
 
-                tracks[str(disc_num)][track_num] = self.generate_track(
+                disc_key = str(disc_num)
+                disc_tracks = tracks.get(disc_key)
+                if disc_tracks is None:
+                    disc_tracks = tracks[disc_key] = {}
+                disc_tracks[track_num] = self.generate_track(
                     trackno=track_num,
                     discno=disc_num,
                     artists=artists,
@@ -187,7 +202,7 @@ class Scraper(AppleMusicBase, MetadataMixin):
             if not tracks:
                 raise ScrapeError("No valid song tracks found in Apple Music API response")
 
-            return dict(tracks)
+            return tracks
 
         except (TypeError, KeyError, ValueError) as e:
             raise ScrapeError("Could not parse tracks from Apple Music API") from e
@@ -202,16 +217,5 @@ def _parse_guest_artists(artist_string: str) -> list[str]:
     Returns:
         Deduplicated list of artist name strings.
     """
-    separators = [" & ", " and ", ", ", " feat. ", " ft. ", " featuring "]
-    normalized = artist_string
-    for sep in separators:
-        normalized = normalized.replace(sep, " | ")
-
-    seen: set[str] = set()
-    result: list[str] = []
-    for artist in normalized.split(" | "):
-        artist = artist.strip()
-        if artist and artist not in seen:
-            seen.add(artist)
-            result.append(artist)
-    return result
+    artists = (artist.strip() for artist in RE_GUEST_SEPARATOR.split(artist_string))
+    return list(dict.fromkeys(artist for artist in artists if artist))
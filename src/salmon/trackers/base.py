@@ -191,6 +191,17 @@ class BaseGazelleApi:
         """
         return f"{self.base_url}/requests.php?action=view&id={id}"
 
+    def torrent_url(self, id: int) -> str:
+        """Get URL for a torrent's permalink.
+
+        Args:
+            id: The torrent ID.
+
+        Returns:
+            The torrent URL.
+        """
+        return f"{self.base_url}/torrents.php?torrentid={id}"
+
     async def authenticate(self) -> None:
         """Authenticate with the tracker API and get authkey/passkey."""
         acctinfo = await self.api_call("index")
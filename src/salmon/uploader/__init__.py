@@ -1,10 +1,11 @@
+import asyncio
 import os
 import platform
-import re
 import shutil
 from typing import TYPE_CHECKING, Any
 
 import anyio
+import anyio.to_thread
 import asyncclick as click
 import pyperclip
 
@@ -19,14 +20,16 @@ from salmon.checks.integrity import (
 from salmon.checks.logs import check_log_cambia
 from salmon.checks.upconverts import upload_upconvert_test
 from salmon.common import commandgroup
+from salmon.common.files import file_suffix, walk_files
 from salmon.constants import ENCODINGS, FORMATS, SOURCES, TAG_ENCODINGS
 from salmon.converter.downconverting import (
     convert_folder,
     generate_conversion_description,
 )
 from salmon.converter.transcoding import (
+    Bitrate,
     generate_transcode_description,
-    transcode_folder,
+    transcode_folders,
 )
 from salmon.errors import AbortAndDeleteFolder, CRCMismatchError, EditedLogError, InvalidMetadataError, RequestError
 from salmon.images import upload_cover
@@ -76,6 +79,9 @@ if TYPE_CHECKING:
     from salmon.tagger.tagfile import TagFile
     from salmon.trackers.base import BaseGazelleApi
 
+GENRE_SEPARATORS = str.maketrans("-_ ", "...")
+FORMAT_NAMES = frozenset(FORMATS.values())
+
 
 @commandgroup.command()
 @click.argument("path", type=click.Path(exists=True, file_okay=False, resolve_path=True))
@@ -311,11 +317,14 @@ async def upload(
     remove_downloaded_cover_image = scene or cfg.image.remove_auto_downloaded_cover_image
     if not source:
         source = await _prompt_source()
-    audio_info = gather_audio_info(path)
-    hybrid = check_hybrid(audio_info)
     if not scene:
         standardize_tags(path)
-    tags = gather_tags(path)
+    # Both passes only read the (now standardized) files, so let their I/O overlap.
+    audio_info, tags = await asyncio.gather(
+        anyio.to_thread.run_sync(gather_audio_info, path),
+        anyio.to_thread.run_sync(gather_tags, path),
+    )
+    hybrid = check_hybrid(audio_info)
     rls_data = construct_rls_data(
         tags,
         audio_info,
@@ -345,27 +354,26 @@ async def upload(
 
         if source == "CD" and not skip_log_check:
             click.secho("\nChecking logs", fg="green")
-            for root, _, files in os.walk(path):
-                for f in files:
-                    if f.lower().endswith(".log"):
-                        filepath = os.path.join(root, f)
-                        click.secho(f"\nScoring {filepath}...", fg="cyan", bold=True)
-                        try:
-                            await check_log_cambia(filepath, path)
-                        except EditedLogError as e:
-                            raise click.Abort() from e
-                        except CRCMismatchError as e:
-                            click.secho("Error: CRC mismatch between log and audio files!", fg="red", bold=True)
-                            if not click.confirm(
-                                click.style(
-                                    "Log file CRC does not match audio files. Do you want to continue upload anyway?",
-                                    fg="magenta",
-                                ),
-                                default=False,
-                            ):
-                                raise click.Abort() from e
-                        except Exception as e:
-                            click.secho(f"Error checking log: {e}", fg="red")
+            log_files = sorted(entry.path for entry in walk_files(path) if file_suffix(entry.name) == ".log")
+            crc_cache: dict[str, str] = {}
+            for filepath in log_files:
+                click.secho(f"\nScoring {filepath}...", fg="cyan", bold=True)
+                try:
+                    await check_log_cambia(filepath, path, crc_cache)
+                except EditedLogError as e:
+                    raise click.Abort() from e
+                except CRCMismatchError as e:
+                    click.secho("Error: CRC mismatch between log and audio files!", fg="red", bold=True)
+                    if not click.confirm(
+                        click.style(
+                            "Log file CRC does not match audio files. Do you want to continue upload anyway?",
+                            fg="magenta",
+                        ),
+                        default=False,
+                    ):
+                        raise click.Abort() from e
+                except Exception as e:
+                    click.secho(f"Error checking log: {e}", fg="red")
 
         if group_id is None:
             searchstrs = generate_dupe_check_searchstrs(rls_data["artists"], rls_data["title"], rls_data["catno"])
@@ -442,6 +450,7 @@ async def upload(
     torrent_id = None
     cover_url = None
     stored_cover_url = None  # Store the cover URL for reuse across trackers
+    pictures_compressed = False  # Embedded pictures only need compressing once per release
     # Regenerate searchstrs (will be used to search for requests)
     searchstrs = generate_dupe_check_searchstrs(rls_data["artists"], rls_data["title"], rls_data["catno"])
 
@@ -488,8 +497,9 @@ async def upload(
                         os.remove(cover_path)
                 cover_url = stored_cover_url
 
-            if not scene and cfg.image.auto_compress_cover:
+            if not scene and cfg.image.auto_compress_cover and not pictures_compressed:
                 compress_pictures(path)
+                pictures_compressed = True
 
             if not request_id and cfg.upload.requests.check_requests:
                 request_id = await check_requests(gazelle_site, searchstrs)
@@ -657,8 +667,11 @@ async def edit_metadata(
         # Refresh tags to accomodate differences in file structure.
         tags = gather_tags(path)
 
-    tags = gather_tags(path)
-    audio_info = gather_audio_info(path)
+    # Files may have been renamed and retagged above; re-read both views of them together.
+    tags, audio_info = await asyncio.gather(
+        anyio.to_thread.run_sync(gather_tags, path),
+        anyio.to_thread.run_sync(gather_audio_info, path),
+    )
     return path, metadata, tags, audio_info
 
 
@@ -694,6 +707,8 @@ async def last_min_dupe_check(gazelle_site, searchstrs):
         gazelle_site: The tracker API instance.
         searchstrs: Search strings for dupe checking.
     """
+    if not searchstrs:
+        return
     # Should really avoid asking if already shown the same releases from the log.
     click.secho(f"Last Minute Dupe Check on {gazelle_site.site_code}", fg="cyan")
     recent_uploads = await dupe_check_recent_torrents(gazelle_site, searchstrs)
@@ -715,7 +730,7 @@ async def last_min_dupe_check(gazelle_site, searchstrs):
 def metadata_validator(metadata):
     """Validate that the provided metadata is not an issue."""
     metadata = metadata_validator_base(metadata)
-    if metadata["format"] not in FORMATS.values():
+    if metadata["format"] not in FORMAT_NAMES:
         raise InvalidMetadataError(f"{metadata['format']} is not a valid format.")
     if metadata["encoding"] not in ENCODINGS:
         raise InvalidMetadataError(f"{metadata['encoding']} is not a valid encoding.")
@@ -798,15 +813,12 @@ async def prompt_downconversion_choice(rls_data, track_data):
 
     click.secho("\nDownconversion Options", fg="cyan", bold=True)
 
-    # Get current format info for display
+    # Get current format info for display; options are only offered when there is track data
     encoding = rls_data["encoding"]
-    if track_data:
+    current_format = f"{encoding}"
+    if encoding == "24bit Lossless" or encoding == "Lossless":
         sample_rate = next(iter(track_data.values()))["sample rate"]
-        current_format = f"{encoding}"
-        if encoding == "24bit Lossless" or encoding == "Lossless":
-            current_format += f" ({sample_rate / 1000:.1f} kHz)"
-    else:
-        current_format = encoding
+        current_format += f" ({sample_rate / 1000:.1f} kHz)"
 
     click.secho(f"Current format: {current_format}", fg="yellow")
     click.secho("Available downconversion formats:", fg="green")
@@ -913,91 +925,66 @@ async def execute_downconversion_tasks(
         if lossy_comment
         else None
     )
+    transcoded_paths: dict[Bitrate, str] = {}
 
     for task in selected_tasks:
         click.secho(f"\nProcessing: {task['name']}", fg="cyan", bold=True)
 
+        # Each action only decides the new folder, its metadata and description; uploading is shared below.
+        task_metadata = metadata.copy()
         if task["action"] == "downconvert":
             # Execute downconversion
             sample_rate, new_path = await convert_folder(
                 base_path, bit_depth=task["target_bitdepth"], sample_rate=task["target_sample_rate"]
             )
-            await anyio.sleep(0.1)
-
-            # Update metadata for this conversion
-            conversion_metadata = metadata.copy()
             if task["target_bitdepth"] == 16:
-                conversion_metadata["encoding"] = "Lossless"
-
-            # Generate description for conversion
+                task_metadata["encoding"] = "Lossless"
             description = generate_conversion_description(base_url, sample_rate, task["target_bitdepth"])
-            click.secho(f"  Generated description: {description[:100]}...", fg="blue")
-            await check_folder_structure(new_path, conversion_metadata["scene"])
-
-            # Upload the converted version
-            torrent_id, group_id, torrent_path, torrent_content, new_url = await upload_and_report(
-                gazelle_site,
-                new_path,
-                group_id,
-                conversion_metadata,
-                cover_url,
-                track_data,
-                hybrid,
-                lossy_master,
-                spectral_urls,
-                spectral_ids,
-                lossy_comment,
-                request_id,
-                source_url,
-                seedbox_uploader,
-                source=source,
-                override_description=description,
-                override_lossy_comment=override_lossy_comment,
-            )
-
-            click.secho(f"  ✓ {task['name']} conversion completed", fg="green")
+            done_label = "conversion"
 
         elif task["action"] == "transcode":
-            # Call transcode function
             click.secho(f"  Target encoding: {task['encoding']}", fg="white")
 
-            # Execute transcoding
-            transcoded_path = await transcode_folder(base_path, task["encoding"])
-            await anyio.sleep(0.1)
-
-            # Update metadata for this transcode
-            transcode_metadata = metadata.copy()
-            transcode_metadata["format"] = "MP3"
-            transcode_metadata["encoding"] = {"320": "320", "V0": "V0 (VBR)"}[task["encoding"]]
-            transcode_metadata["encoding_vbr"] = {"320": False, "V0": True}[task["encoding"]]
+            # Transcode every selected bitrate in one pass the first time one is needed
+            if task["encoding"] not in transcoded_paths:
+                bitrates = [t["encoding"] for t in selected_tasks if t["action"] == "transcode"]
+                transcoded_paths = await transcode_folders(base_path, bitrates)
+            new_path = transcoded_paths[task["encoding"]]
 
-            # Generate description for transcode
+            task_metadata["format"] = "MP3"
+            task_metadata["encoding"] = {"320": "320", "V0": "V0 (VBR)"}[task["encoding"]]
+            task_metadata["encoding_vbr"] = {"320": False, "V0": True}[task["encoding"]]
             description = generate_transcode_description(base_url, task["encoding"])
-            click.secho(f"  Generated description: {description[:100]}...", fg="blue")
-            await check_folder_structure(transcoded_path, transcode_metadata["scene"])
-
-            # Upload the transcoded version
-            torrent_id, group_id, torrent_path, torrent_content, new_url = await upload_and_report(
-                gazelle_site,
-                transcoded_path,
-                group_id,
-                transcode_metadata,
-                cover_url,
-                track_data,
-                hybrid,
-                lossy_master,
-                spectral_urls,
-                spectral_ids,
-                lossy_comment,
-                request_id,
-                source_url,
-                seedbox_uploader,
-                source=source,
-                override_description=description,
-                override_lossy_comment=override_lossy_comment,
-            )
+            done_label = "transcode"
+
+        else:
+            continue
+
+        click.secho(f"  Generated description: {description[:100]}...", fg="blue")
+        await check_folder_structure(new_path, task_metadata["scene"])
+
+        # Upload the converted version
+        torrent_id, group_id, torrent_path, torrent_content, new_url = await upload_and_report(
+            gazelle_site,
+            new_path,
+            group_id,
+            task_metadata,
+            cover_url,
+            track_data,
+            hybrid,
+            lossy_master,
+            spectral_urls,
+            spectral_ids,
+            lossy_comment,
+            request_id,
+            source_url,
+            seedbox_uploader,
+            source=source,
+            override_description=description,
+            override_lossy_comment=override_lossy_comment,
+        )
 
-            click.secho(f"  ✓ {task['name']} transcode completed", fg="green")
+        click.secho(f"  ✓ {task['name']} {done_label} completed", fg="green")
 
 
 async def upload_and_report(
@@ -1077,7 +1064,7 @@ async def upload_and_report(
         )
 
     # Generate URL
-    url = f"{gazelle_site.base_url}/torrents.php?torrentid={torrent_id}"
+    url = gazelle_site.torrent_url(torrent_id)
 
     torrent_content.comment = url
     torrent_content.write(torrent_path, overwrite=True)
@@ -1095,7 +1082,6 @@ async def upload_and_report(
 
     # Add to seedbox upload queue
     if cfg.upload.upload_to_seedbox:
-        click.secho("Add uploading task.", fg="green")
         # Check if it's a FLAC file
         is_flac = metadata.get("format", "").upper() == "FLAC"
         seedbox_uploader.add_upload_task(path, task_type="folder", is_flac=is_flac)
@@ -1106,7 +1092,7 @@ async def upload_and_report(
 
 def convert_genres(genres):
     """Convert the weirdly spaced genres to RED-compliant genres."""
-    return ",".join(re.sub("[-_ ]", ".", g).strip() for g in genres)
+    return ",".join(g.translate(GENRE_SEPARATORS).strip() for g in genres)
 
 
 async def _prompt_source():
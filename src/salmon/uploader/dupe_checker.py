@@ -1,6 +1,7 @@
 import asyncio
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from urllib import parse
 
@@ -24,6 +25,8 @@ async def dupe_check_recent_torrents(gazelle_site: "BaseGazelleApi", searchstrs:
     Returns:
         List of matching upload tuples (id, artist, title).
     """
+    if not searchstrs:
+        return []
     searchstr = searchstrs[0]
     recent_uploads = await gazelle_site.get_uploads_from_log()
     # Each upload in this list is best guess at (id,artist,title) from log
@@ -63,7 +66,7 @@ def print_recent_upload_results(gazelle_site: "BaseGazelleApi", recent_uploads:
         click.secho(f" (searchstrs: {searchstr})", bold=True)
         for u in recent_uploads[:5]:
             click.secho(
-                f"{u[1]} - {u[2]} | {gazelle_site.base_url}/torrents.php?torrentid={u[0]}",
+                f"{u[1]} - {u[2]} | {gazelle_site.torrent_url(u[0])}",
                 fg="cyan",
             )
 
@@ -96,7 +99,7 @@ async def _prompt_for_recent_upload_results(
         for u_index, u in enumerate(recent_uploads[:5]):
             click.echo(f" {u_index + 1:02d} >> ", nl=False)  # torrent_id
             click.secho(f"{u[1]} - {u[2]} ", fg="cyan", nl=False)  # artist - title
-            click.echo(f"| {gazelle_site.base_url}/torrents.php?torrentid={u[0]}")
+            click.echo(f"| {gazelle_site.torrent_url(u[0])}")
 
     # Now prompt for user action
     while True:
@@ -215,6 +218,13 @@ async def get_search_results(gazelle_site: "BaseGazelleApi", searchstrs: list[st
 
 
 def generate_dupe_check_searchstrs(artists, album, catno=None):
+    # Called several times per upload (and once per log entry) with the same inputs, so results
+    # are memoized on a hashable copy of the artist list.
+    return list(_generate_dupe_check_searchstrs(tuple(map(tuple, artists)), album, catno))
+
+
+@lru_cache(maxsize=256)
+def _generate_dupe_check_searchstrs(artists, album, catno):
     searchstrs = []
     album = _sanitize_album_for_dupe_check(album)
     searchstrs += make_searchstrs(artists, album, normalize=True)
@@ -227,7 +237,7 @@ def generate_dupe_check_searchstrs(artists, album, catno=None):
         searchstrs += make_searchstrs(artists, album.split("/")[0], normalize=True)
     elif catno and album is not None and catno.lower() in album.lower():
         searchstrs += make_searchstrs(artists, "untitled", normalize=True)
-    return filter_unnecessary_searchstrs(searchstrs)
+    return tuple(filter_unnecessary_searchstrs(searchstrs))
 
 
 def _sanitize_album_for_dupe_check(album):
@@ -99,6 +99,8 @@ class UploadManager:
 
         # Each task: (seedbox, local_path, task_type)
         self.tasks: collections.deque[tuple[Seedbox, str, str]] = collections.deque()
+        # (seedbox index, local_path, task_type) of every queued task; Seedbox itself is unhashable.
+        self._queued: set[tuple[int, str, str]] = set()
 
     def _client(self, seedbox: Seedbox) -> TorrentClient:
         """Look up the cached torrent client for a seedbox entry.
@@ -120,14 +122,16 @@ class UploadManager:
             is_flac: Whether the release is FLAC; skips seedboxes with flac_only=True if False.
         """
         click.secho(f"Preparing upload tasks for: {directory}", fg="cyan")
-        for seedbox in cfg.seedbox:
+        for idx, seedbox in enumerate(cfg.seedbox):
             if seedbox.torrent_client not in self._client_cache:
                 continue
             if seedbox.flac_only and not is_flac:
                 continue
-            task = (seedbox, directory, task_type)
-            if task in self.tasks:
+            key = (idx, directory, task_type)
+            if key in self._queued:
                 continue
+            self._queued.add(key)
+            task = (seedbox, directory, task_type)
             if task_type == "seed":
                 self.tasks.append(task)
                 click.secho("Added seed task", fg="magenta")
@@ -163,3 +167,4 @@ class UploadManager:
 
         click.secho("\nAll upload tasks processed", fg="green")
         self.tasks.clear()
+        self._queued.clear()
@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+from pathlib import Path
+
+from mutagen import flac
+
+
+def flac_block(block_type: int, body: bytes, *, last: bool = False) -> bytes:
+    return bytes([block_type | (0x80 if last else 0)]) + len(body).to_bytes(3, "big") + body
+
+
+def write_flac(
+    path: Path,
+    comments: Sequence[str] = (),
+    *,
+    channels: int = 2,
+    picture: bytes | None = None,
+) -> None:
+    """Write a metadata-only FLAC file: STREAMINFO, an optional JPEG cover, comments and padding."""
+    # 44.1 kHz, 16 bit; sample rate (20 bits) | channels - 1 (3 bits) | bps - 1 (5 bits) | total samples (36 bits)
+    packed = (44100 << 44) | ((channels - 1) << 41) | (15 << 36)
+    streaminfo = b"\x10\x00\x10\x00" + b"\x00" * 6 + packed.to_bytes(8, "big") + b"\x00" * 16
+    vendor = b"reference libFLAC 1.4.3"
+    vorbis = len(vendor).to_bytes(4, "little") + vendor + len(comments).to_bytes(4, "little")
+    for comment in comments:
+        raw = comment.encode()
+        vorbis += len(raw).to_bytes(4, "little") + raw
+    blocks = [flac_block(0, streaminfo)]
+    if picture is not None:
+        pic = flac.Picture()
+        pic.mime = "image/jpeg"
+        pic.type = 3
+        pic.data = picture
+        blocks.append(flac_block(6, pic.write()))
+    blocks.append(flac_block(4, vorbis))
+    blocks.append(flac_block(1, b"\x00" * 64, last=True))
+    path.write_bytes(b"fLaC" + b"".join(blocks))
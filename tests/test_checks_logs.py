@@ -0,0 +1,42 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import anyio
+import cambia
+
+from salmon.checks import logs
+
+
+def _cambia_output(copy_crcs: list[str]) -> SimpleNamespace:
+    tracks = [SimpleNamespace(is_range=False, test_and_copy=SimpleNamespace(copy_hash=crc)) for crc in copy_crcs]
+    parsed_log = SimpleNamespace(checksum=SimpleNamespace(integrity=cambia.Integrity.Match), tracks=tracks)
+    return SimpleNamespace(
+        evaluation_combined=[SimpleNamespace(combined_score=100)],
+        parsed=SimpleNamespace(parsed_logs=[parsed_log]),
+    )
+
+
+def test_check_log_cambia_reuses_crc_cache_across_logs(tmp_path: Path, monkeypatch) -> None:
+    for name in ("01. One.flac", "02. Two.flac"):
+        (tmp_path / name).touch()
+    crcs = {"01. One.flac": "AAAAAAAA", "02. Two.flac": "BBBBBBBB"}
+    decoded: list[str] = []
+
+    async def fake_crc(filepath: str, _=None) -> str:
+        decoded.append(filepath)
+        return crcs[Path(filepath).name]
+
+    monkeypatch.setattr(logs.cambia, "parse_log_file", lambda _path: _cambia_output(list(crcs.values())))
+    monkeypatch.setattr(logs, "_calculate_file_crc_async", fake_crc)
+    monkeypatch.setattr(logs.click, "secho", lambda *args, **kwargs: None)
+
+    async def check_both() -> dict[str, str]:
+        cache: dict[str, str] = {}
+        await logs.check_log_cambia(str(tmp_path / "disc1.log"), str(tmp_path), cache)
+        await logs.check_log_cambia(str(tmp_path / "disc2.log"), str(tmp_path), cache)
+        return cache
+
+    cache = anyio.run(check_both)
+
+    assert sorted(decoded) == sorted(str(tmp_path / name) for name in crcs)
+    assert set(cache.values()) == set(crcs.values())
@@ -0,0 +1,185 @@
+import io
+from pathlib import Path
+
+import asyncclick as click
+import pytest
+from flac_fixtures import flac_block, write_flac
+from mutagen import flac
+from mutagen.id3 import APIC, ID3
+
+from salmon.converter import transcoding
+
+
+def test_scan_source_splits_flac_and_extra_files_in_one_pass(tmp_path: Path) -> None:
+    (tmp_path / "CD2").mkdir()
+    (tmp_path / "02. Two.flac").touch()
+    (tmp_path / "01. One.FLAC").touch()
+    (tmp_path / "CD2" / "01. Three.flac").touch()
+    (tmp_path / "cover.jpg").touch()
+    (tmp_path / "CD2" / "rip.log").touch()
+
+    flac_files, extra_files = transcoding._scan_source(str(tmp_path))
+
+    assert flac_files == [
+        tmp_path / "01. One.FLAC",
+        tmp_path / "02. Two.flac",
+        tmp_path / "CD2" / "01. Three.flac",
+    ]
+    assert sorted(extra_files) == [tmp_path / "CD2" / "rip.log", tmp_path / "cover.jpg"]
+
+
+def test_scan_source_aborts_on_lossy_file(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(transcoding.click, "secho", lambda *args, **kwargs: None)
+    (tmp_path / "01. One.flac").touch()
+    (tmp_path / "01. One.mp3").touch()
+
+    with pytest.raises(click.Abort):
+        transcoding._scan_source(str(tmp_path))
+
+
+def test_read_flac_metadata_matches_mutagen(tmp_path: Path) -> None:
+    path = tmp_path / "01. One.flac"
+    write_flac(
+        path,
+        ["TITLE=One", "ARTIST=A", "Artist=B", "TRACKNUMBER=1", "COMMENT=x=y"],
+        picture=b"\xff\xd8jpeg",
+    )
+
+    meta = transcoding._read_flac_metadata(path)
+    reference = flac.FLAC(path)
+
+    assert reference.tags is not None
+    assert meta.tags == reference.tags.as_dict()
+    assert meta.channels == reference.info.channels == 2
+    assert meta.picture_size == len(reference.pictures[0].write())
+
+
+def test_read_flac_metadata_without_pictures(tmp_path: Path) -> None:
+    path = tmp_path / "01. One.flac"
+    write_flac(path, ["TITLE=One"], channels=6)
+
+    meta = transcoding._read_flac_metadata(path)
+
+    assert meta.channels == 6
+    assert meta.picture_size == 0
+    assert meta.tags == {"title": ["One"]}
+
+
+def test_read_flac_metadata_rejects_non_flac(tmp_path: Path) -> None:
+    path = tmp_path / "01. One.flac"
+    path.write_bytes(b"RIFF" + b"\x00" * 64)
+
+    with pytest.raises(ValueError, match="Not a valid FLAC file"):
+        transcoding._read_flac_metadata(path)
+
+
+def _vorbis_body(count: int, comments: list[bytes]) -> bytes:
+    body = (0).to_bytes(4, "little") + count.to_bytes(4, "little")
+    return body + b"".join(len(raw).to_bytes(4, "little") + raw for raw in comments)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param(_vorbis_body(2, [b"TITLE=x"]), id="missing-comment"),
+        pytest.param(_vorbis_body(1, [b"TITLE=x"])[:-3], id="truncated-comment"),
+        pytest.param(_vorbis_body(50_000_000, [b"TITLE=x"]), id="over-counted"),
+        pytest.param((64).to_bytes(4, "little") + b"vendor", id="truncated-vendor"),
+    ],
+)
+def test_parse_vorbis_comment_rejects_malformed_block(body: bytes) -> None:
+    with pytest.raises(ValueError, match="Malformed VORBIS_COMMENT block"):
+        transcoding._parse_vorbis_comment(body, Path("01. One.flac"))
+
+
+def test_read_flac_metadata_rejects_truncated_streaminfo(tmp_path: Path) -> None:
+    path = tmp_path / "01. One.flac"
+    path.write_bytes(b"fLaC" + flac_block(0, b"\x10\x00\x10\x00" + b"\x00" * 8, last=True))
+
+    with pytest.raises(ValueError, match="Truncated STREAMINFO block"):
+        transcoding._read_flac_metadata(path)
+
+
+def test_prepare_tags_merges_totals_and_drops_unwanted_tags() -> None:
+    tags = {
+        "title": ["One"],
+        "tracknumber": ["1"],
+        "tracktotal": ["9"],
+        "totaltracks": ["9"],
+        "discnumber": ["2"],
+        "disctotal": ["2"],
+        "replaygain_track_gain": ["-6.00 dB"],
+        "encoder": ["FLAC 1.4.3"],
+    }
+
+    result = transcoding._prepare_tags(tags)
+
+    assert result == {"title": ["One"], "tracknumber": ["1/9"], "discnumber": ["2/2"]}
+    assert "tracktotal" in tags
+
+
+def test_prepare_tags_rejects_conflicting_totals() -> None:
+    with pytest.raises(ValueError, match="conflicting values"):
+        transcoding._prepare_tags({"tracknumber": ["1"], "tracktotal": ["9"], "totaltracks": ["10"]})
+
+
+@pytest.mark.parametrize(
+    ("foldername", "expected"),
+    [
+        ("Artist - Album (2020) [WEB FLAC]", "Artist - Album (2020) [WEB MP3 V0]"),
+        ("Artist - Album (2020) [WEB 24bit flac]", "Artist - Album (2020) [WEB MP3 V0]"),
+        ("Artist - Album (2020) [FLAC Lossless]", "Artist - Album (2020) [MP3 V0]"),
+        ("Artist - Album (2020) [lossless]", "Artist - Album (2020) [V0] [MP3]"),
+        ("Artist - Album (2020)", "Artist - Album (2020) [MP3 V0]"),
+    ],
+)
+def test_build_output_path(foldername: str, expected: str) -> None:
+    assert transcoding._build_output_path(f"/music/{foldername}", "V0") == f"/music/{expected}"
+
+
+def test_read_flac_pictures_matches_mutagen(tmp_path: Path) -> None:
+    path = tmp_path / "01. One.flac"
+    write_flac(path, ["TITLE=One"], picture=b"\xff\xd8jpeg")
+
+    pictures = transcoding._read_flac_pictures(path)
+
+    assert [(p.mime, p.type, p.data) for p in pictures] == [(p.mime, p.type, p.data) for p in flac.FLAC(path).pictures]
+    assert pictures[0].data == b"\xff\xd8jpeg"
+
+
+def test_estimate_id3_size_covers_the_frames_mutagen_writes() -> None:
+    tags = {"title": ["Ünïcode title"], "artist": ["A", "B"], "custom tag": ["value"]}
+    picture = flac.Picture()
+    picture.mime = "image/jpeg"
+    picture.data = b"\xff" * 5000
+
+    id3 = ID3()
+    for key, value in tags.items():
+        id3.add(transcoding._get_id3_frame(key, value))
+    id3.add(APIC(encoding=3, mime=picture.mime, type=picture.type, desc=picture.desc, data=picture.data))
+    buffer = io.BytesIO()
+    id3.save(buffer, v2_version=4, padding=lambda info: 0)
+
+    estimate = transcoding._estimate_id3_size(tags, len(picture.write()))
+
+    assert len(buffer.getvalue()) <= estimate <= len(buffer.getvalue()) + 10 * 1024
+
+
+def test_collect_transcode_items_reads_each_flac_once_for_all_bitrates(tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "Album [FLAC]"
+    (src / "CD1").mkdir(parents=True)
+    write_flac(src / "CD1" / "01. One.flac", ["TITLE=One"])
+    parsed: list[Path] = []
+    parse = transcoding._parse_flac_tags
+    monkeypatch.setattr(transcoding, "_parse_flac_tags", lambda f: parsed.append(f) or parse(f))
+
+    items = transcoding._collect_transcode_items(
+        [src / "CD1" / "01. One.flac"], str(src), {"320": "/out/320", "V0": "/out/V0"}
+    )
+
+    assert parsed == [src / "CD1" / "01. One.flac"]
+    assert [(item.bitrate, item.dst) for item in items] == [
+        ("320", str(Path("/out/320/CD1/01. One.mp3"))),
+        ("V0", str(Path("/out/V0/CD1/01. One.mp3"))),
+    ]
+    assert items[0].tags == items[1].tags == {"title": ["One"]}
@@ -0,0 +1,61 @@
+import anyio
+import pytest
+
+from salmon.errors import ScrapeError
+from salmon.tagger.sources import apple_music
+
+
+def test_parse_guest_artists_splits_on_all_separators_and_dedupes() -> None:
+    result = apple_music._parse_guest_artists("A & B, C and D feat. E ft. F featuring A")
+
+    assert result == ["A", "B", "C", "D", "E", "F"]
+
+
+def test_parse_guest_artists_only_splits_on_whole_separator_words() -> None:
+    assert apple_music._parse_guest_artists("Andy Anderson") == ["Andy Anderson"]
+    assert apple_music._parse_guest_artists("Mandy,Candy") == ["Mandy,Candy"]
+
+
+@pytest.mark.parametrize(
+    ("release_date", "year"),
+    [("2019-10-04", 2019), ("2019-10-04T07:00:00Z", 2019), ("2019", 2019)],
+)
+def test_parse_release_year_reads_iso_prefix(release_date: str, year: int) -> None:
+    assert apple_music.Scraper().parse_release_year({"album": {"releaseDate": release_date}}) == year
+
+
+@pytest.mark.parametrize("release_date", ["", "Oct 4, 2019", "20191004", None])
+def test_parse_release_year_rejects_non_iso_dates(release_date: str | None) -> None:
+    with pytest.raises(ScrapeError):
+        apple_music.Scraper().parse_release_year({"album": {"releaseDate": release_date}})
+
+
+def test_parse_tracks_groups_by_disc_and_extracts_guests() -> None:
+    def song(disc: int, track: int, name: str) -> dict:
+        return {
+            "type": "songs",
+            "attributes": {"name": name, "artistName": "Main", "trackNumber": track, "discNumber": disc},
+        }
+
+    soup = {
+        "tracks": [
+            song(1, 1, "Intro"),
+            song(1, 2, "Song (feat. Guest A & Guest B)"),
+            {"type": "music-videos", "attributes": {"name": "Video", "trackNumber": 3, "discNumber": 1}},
+            song(2, 1, "Outro"),
+        ]
+    }
+
+    tracks = anyio.run(apple_music.Scraper().parse_tracks, soup)
+
+    assert list(tracks) == ["1", "2"]
+    assert list(tracks["1"]) == [1, 2]
+    assert tracks["1"][2]["title"] == "Song"
+    assert tracks["1"][2]["artists"] == [("Main", "main"), ("Guest A", "guest"), ("Guest B", "guest")]
+    assert tracks["2"][1]["artists"] == [("Main", "main")]
+
+
+def test_parse_genres_applies_aliases() -> None:
+    soup = {"album": {"genreNames": ["Hip-Hop/Rap", "Music", "Jazz", ""]}}
+
+    assert apple_music.Scraper().parse_genres(soup) == {"Hip Hop", "Rap", "Jazz"}
@@ -0,0 +1,53 @@
+import io
+from pathlib import Path
+
+from flac_fixtures import write_flac
+from mutagen import flac
+from PIL import Image
+
+from salmon.tagger import cover
+
+
+def _jpeg(size: tuple[int, int] = (64, 64), *, trailing: int = 0) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 40, 40)).save(buffer, "jpeg")
+    # Bytes after the EOI marker are ignored by decoders, which makes an oversized yet tiny-to-recompress cover
+    return buffer.getvalue() + b"\x00" * trailing
+
+
+def test_compress_pictures_embeds_folder_cover_in_every_file(tmp_path: Path) -> None:
+    cover_data = _jpeg()
+    (tmp_path / "cover.jpg").write_bytes(cover_data)
+    for name in ("01. One.flac", "02. Two.flac"):
+        write_flac(tmp_path / name)
+
+    cover.compress_pictures(str(tmp_path))
+
+    for name in ("01. One.flac", "02. Two.flac"):
+        pictures = flac.FLAC(tmp_path / name).pictures
+        assert len(pictures) == 1
+        assert pictures[0].data == cover_data
+        assert pictures[0].mime == "image/jpeg"
+
+
+def test_compress_pictures_reuses_cover_extracted_from_oversized_file(tmp_path: Path, monkeypatch) -> None:
+    oversized = _jpeg(trailing=1024 * 1024)
+    compressions: list[int] = []
+    original_compress = cover.compress_to_target_size
+
+    def counting_compress(image, target_size):
+        compressions.append(target_size)
+        return original_compress(image, target_size)
+
+    monkeypatch.setattr(cover, "compress_to_target_size", counting_compress)
+    write_flac(tmp_path / "01. One.flac", picture=oversized)
+    write_flac(tmp_path / "02. Two.flac")
+
+    cover.compress_pictures(str(tmp_path))
+
+    assert (tmp_path / "cover.jpg").read_bytes() == oversized
+    assert len(compressions) == 1
+    first, second = (flac.FLAC(tmp_path / name).pictures for name in ("01. One.flac", "02. Two.flac"))
+    assert len(first) == len(second) == 1
+    assert len(first[0].data) < len(oversized)
+    assert first[0].data == second[0].data
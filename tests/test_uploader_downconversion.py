@@ -0,0 +1,101 @@
+from typing import Any
+
+import anyio
+
+import salmon.uploader as uploader
+
+TRANSCODE_320 = {"name": "MP3 320", "action": "transcode", "encoding": "320"}
+TRANSCODE_V0 = {"name": "MP3 V0", "action": "transcode", "encoding": "V0"}
+DOWNCONVERT_16 = {"name": "16bit 44.1 kHz", "action": "downconvert", "target_bitdepth": 16, "target_sample_rate": 44100}
+
+
+def _stub_pipeline(monkeypatch) -> dict[str, list[Any]]:
+    calls: dict[str, list[Any]] = {"transcode": [], "convert": [], "upload": []}
+
+    async def fake_transcode_folders(path: str, bitrates: list[str]) -> dict[str, str]:
+        calls["transcode"].append((path, list(bitrates)))
+        return {bitrate: f"{path} [{bitrate}]" for bitrate in bitrates}
+
+    async def fake_convert_folder(path: str, bit_depth: int, sample_rate: int) -> tuple[int, str]:
+        calls["convert"].append((path, bit_depth, sample_rate))
+        return sample_rate, f"{path} [{bit_depth}-{sample_rate}]"
+
+    async def fake_upload_and_report(gazelle_site, path: str, group_id, metadata, *args, **kwargs):
+        calls["upload"].append((path, metadata["encoding"]))
+        # Let any concurrently scheduled upload run before this one finishes
+        await anyio.sleep(0)
+        calls["upload"].append(("done", path))
+        return 1, 2, f"{path}.torrent", b"", "https://tracker.example/torrents.php?torrentid=1"
+
+    async def fake_check_folder_structure(path: str, scene: bool) -> None:
+        pass
+
+    monkeypatch.setattr(uploader, "transcode_folders", fake_transcode_folders)
+    monkeypatch.setattr(uploader, "convert_folder", fake_convert_folder)
+    monkeypatch.setattr(uploader, "upload_and_report", fake_upload_and_report)
+    monkeypatch.setattr(uploader, "check_folder_structure", fake_check_folder_structure)
+    monkeypatch.setattr(uploader.click, "secho", lambda *args, **kwargs: None)
+    return calls
+
+
+def _run(selected_tasks: list[dict[str, Any]]) -> None:
+    anyio.run(
+        uploader.execute_downconversion_tasks,
+        selected_tasks,
+        "/music/Album",
+        None,
+        None,
+        {"format": "FLAC", "encoding": "24bit Lossless", "encoding_vbr": False, "scene": False},
+        None,
+        {},
+        False,
+        False,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        "WEB",
+        "https://tracker.example/torrents.php?torrentid=1",
+    )
+
+
+def test_execute_downconversion_tasks_transcodes_all_bitrates_once(monkeypatch) -> None:
+    calls = _stub_pipeline(monkeypatch)
+
+    _run([TRANSCODE_320, TRANSCODE_V0])
+
+    assert calls["transcode"] == [("/music/Album", ["320", "V0"])]
+    assert calls["upload"] == [
+        ("/music/Album [320]", "320"),
+        ("done", "/music/Album [320]"),
+        ("/music/Album [V0]", "V0 (VBR)"),
+        ("done", "/music/Album [V0]"),
+    ]
+
+
+def test_execute_downconversion_tasks_uploads_serially_in_task_order(monkeypatch) -> None:
+    calls = _stub_pipeline(monkeypatch)
+
+    _run([DOWNCONVERT_16, TRANSCODE_V0, TRANSCODE_320])
+
+    assert calls["transcode"] == [("/music/Album", ["V0", "320"])]
+    assert calls["upload"] == [
+        ("/music/Album [16-44100]", "Lossless"),
+        ("done", "/music/Album [16-44100]"),
+        ("/music/Album [V0]", "V0 (VBR)"),
+        ("done", "/music/Album [V0]"),
+        ("/music/Album [320]", "320"),
+        ("done", "/music/Album [320]"),
+    ]
+
+
+def test_execute_downconversion_tasks_skips_transcoding_for_downconvert_only(monkeypatch) -> None:
+    calls = _stub_pipeline(monkeypatch)
+
+    _run([DOWNCONVERT_16])
+
+    assert calls["transcode"] == []
+    assert calls["convert"] == [("/music/Album", 16, 44100)]
+    assert calls["upload"] == [("/music/Album [16-44100]", "Lossless"), ("done", "/music/Album [16-44100]")]
@@ -0,0 +1,24 @@
+import anyio
+
+from salmon.uploader import dupe_checker
+
+
+def test_generate_dupe_check_searchstrs_is_memoized_and_returns_fresh_lists() -> None:
+    dupe_checker._generate_dupe_check_searchstrs.cache_clear()
+    artists = [["Artist", "main"], ["Guest", "guest"]]
+
+    first = dupe_checker.generate_dupe_check_searchstrs(artists, "Album (Deluxe Edition)", "CAT001")
+    expected = list(first)
+    first.append("mutated")
+    second = dupe_checker.generate_dupe_check_searchstrs(artists, "Album (Deluxe Edition)", "CAT001")
+
+    assert second == expected
+    assert dupe_checker._generate_dupe_check_searchstrs.cache_info().hits == 1
+
+
+def test_dupe_check_recent_torrents_skips_log_fetch_without_searchstrs() -> None:
+    class Site:
+        async def get_uploads_from_log(self):
+            raise AssertionError("log should not be fetched")
+
+    assert anyio.run(dupe_checker.dupe_check_recent_torrents, Site(), []) == []
@@ -50,3 +50,20 @@ def test_rclone_upload_folder_reports_nonzero_exit_code(monkeypatch) -> None:
     )
 
     assert "Rclone upload failed with exit code 7" in messages
+
+
+def test_add_upload_task_skips_duplicates_and_runs_folders_first(monkeypatch) -> None:
+    boxes = [Seedbox(url="one", torrent_client="qbittorrent://one"), Seedbox(url="two", flac_only=True)]
+    monkeypatch.setattr(seedbox.cfg, "seedbox", boxes)
+    monkeypatch.setattr(seedbox.TorrentClientGenerator, "parse_libtc_url", lambda url: object())
+    monkeypatch.setattr(seedbox.click, "secho", lambda *args, **kwargs: None)
+
+    manager = seedbox.UploadManager()
+    for _ in range(2):
+        manager.add_upload_task("/tmp/Album [MP3]", task_type="folder", is_flac=False)
+        manager.add_upload_task("/tmp/Album.torrent", task_type="seed", is_flac=False)
+
+    assert [(box.url, path, kind) for box, path, kind in manager.tasks] == [
+        ("one", "/tmp/Album [MP3]", "folder"),
+        ("one", "/tmp/Album.torrent", "seed"),
+    ]